@@ -72,8 +72,12 @@ def _save_used_indices(used: list, tracker_file: str):
         used: List of used indices.
         tracker_file: Target path for the JSON file.
     """
-    with open(tracker_file, 'w') as f:
+    # Write beside the target and swap it in, so a reader never sees a
+    # half-written tracker if the script is interrupted mid-save.
+    tmp_file = tracker_file + ".tmp"
+    with open(tmp_file, 'w') as f:
         json.dump({"used_combos": used}, f, indent=4)
+    os.replace(tmp_file, tracker_file)
 
 
 def next_random_combo(active_combos: list, tracker_file: str) -> tuple:
@@ -103,6 +103,7 @@ HAMMER_NORMAL_HIT_STOP = 7      # Heavy weapon impact.
 HAMMER_HIT_STOP_FRAMES = 13      # Critical heavy weapon impact.
 SCREEN_SHAKE_INTENSITY = 15
 SCREEN_SHAKE_DECAY = 0.85
+SHAKE_NOISE_SIZE = 4096         # Precomputed shake offsets (power of two, cycled by mask).
 
 # Brief time dilation after any hit to allow the viewer to process the impact.
 HIT_SLOWMO_FRAMES = 5
@@ -120,6 +121,7 @@ WALL_BOOST_STRENGTH = 4
 
 # Anti-staleness: pulses the arena to force interactions if no hits occur.
 INACTIVITY_PULSE_TIME = 2.5
+INACTIVITY_PULSE_FRAMES = int(INACTIVITY_PULSE_TIME * FPS)   # Same threshold in sim frames.
 ARENA_PULSE_VELOCITY_BOOST = 4
 ARENA_PULSE_SHAKE = 6
 
@@ -26,6 +26,21 @@ PARRY_SPARK_COLORS = {
     "hammer": (255, 160,   0),   # deep amber / gold
 }
 
+# (color, radius) -> colorkeyed disc sprite, shared by every ParticleSystem.
+# Particles only come in a handful of colors and integer radii, so this stays small.
+_particle_sprites = {}
+
+
+def _render_particle_sprite(color, r):
+    """Rasterizes a particle disc once; blitting it at (x - r, y - r) matches draw.circle."""
+    key_color = next(k for k in ((0, 0, 0), (0, 0, 1), (0, 1, 0)) if k != color)
+    size = r * 2 + 1
+    sprite = pygame.Surface((size, size))
+    sprite.fill(key_color)
+    sprite.set_colorkey(key_color)
+    pygame.draw.circle(sprite, color, (r, r), r)
+    return sprite
+
 
 class Particle:
     """A single visual entity with physical properties.
@@ -33,6 +48,8 @@ class Particle:
     Particles use basic Newtonian physics (velocity, gravity, drag) and a 
     finite lifecycle to create transient visual artifacts like sparks or dust.
     """
+
+    __slots__ = ('x', 'y', 'color', 'vx', 'vy', 'size', 'lifetime', 'max_lifetime')
     
     def __init__(self, x: float, y: float, color: tuple, velocity: tuple = None, size: float = 4, lifetime: int = 25):
         """Initializes a particle.
@@ -71,15 +88,6 @@ class Particle:
         self.lifetime -= 1
         self.size = max(1, self.size * 0.95) # Gradually shrink
         return self.lifetime > 0
-    
-    def draw(self, surface: pygame.Surface, offset=(0, 0)):
-        """Renders the particle to the surface."""
-        if self.lifetime <= 0:
-            return
-        ox, oy = offset
-        pygame.draw.circle(surface, self.color, 
-                          (int(self.x + ox), int(self.y + oy)), 
-                          int(self.size))
 
 
 class ParticleSystem:
@@ -91,6 +99,10 @@ class ParticleSystem:
     def __init__(self):
         """Initializes an empty particle system."""
         self.particles = []
+
+    def __len__(self):
+        """Number of live particles; an empty system is falsy so callers can skip it."""
+        return len(self.particles)
     
     def emit(self, x, y, color, count=8, size=4, lifetime=25):
         """Spawns a standard cluster of particles."""
@@ -111,9 +123,29 @@ class ParticleSystem:
         self.particles = [p for p in self.particles if p.update()]
     
     def draw(self, surface, offset=(0, 0)):
-        """Renders all active particles."""
+        """Renders all active particles.
+
+        Pixel-identical to a pygame.draw.circle per particle, but every disc
+        is a cached sprite and the whole batch goes out in one blits call.
+        """
+        ox, oy = offset
+        width, height = surface.get_size()
+        sprites = _particle_sprites
+        stamps = []
         for p in self.particles:
-            p.draw(surface, offset)
+            if p.lifetime > 0:
+                r = int(p.size)
+                left = int(p.x + ox) - r
+                top = int(p.y + oy) - r
+                # Bursts fling sparks past the edges; skip those before the sprite lookup
+                if left > width or top > height or left + 2 * r < 0 or top + 2 * r < 0:
+                    continue
+                key = (p.color, r)
+                sprite = sprites.get(key)
+                if sprite is None:
+                    sprite = sprites[key] = _render_particle_sprite(p.color, r)
+                stamps.append((sprite, (left, top)))
+        surface.blits(stamps, doreturn=False)
     
     def clear(self):
         """Removes all particles from the system."""
@@ -152,6 +184,8 @@ class Shockwave:
     Typically used to signal high-impact events like round starts or 
     arena pulses.
     """
+
+    __slots__ = ('x', 'y', 'color', 'radius', 'max_radius', 'lifetime', 'max_lifetime')
     
     def __init__(self, x, y, color, max_radius=150):
         """Initializes the shockwave."""
@@ -186,6 +220,9 @@ class ShockwaveSystem:
     
     def __init__(self):
         self.shockwaves = []
+
+    def __len__(self):
+        return len(self.shockwaves)
     
     def add(self, x, y, color, max_radius=150):
         self.shockwaves.append(Shockwave(x, y, color, max_radius))
@@ -194,8 +231,15 @@ class ShockwaveSystem:
         self.shockwaves = [s for s in self.shockwaves if s.update()]
     
     def draw(self, surface, offset=(0, 0)):
-        for s in self.shockwaves:
-            s.draw(surface, offset)
+        if not self.shockwaves:
+            return
+        # One explicit lock for the whole pass instead of one per primitive call
+        surface.lock()
+        try:
+            for s in self.shockwaves:
+                s.draw(surface, offset)
+        finally:
+            surface.unlock()
     
     def clear(self):
         self.shockwaves.clear()
@@ -207,6 +251,9 @@ class ArenaPulse:
     Designed as a subtle peripheral signal — thin, fast, and unobtrusive so it
     doesn't compete with the fighters for viewer attention.
     """
+
+    __slots__ = ('ax', 'ay', 'aw', 'ah', 'color', 'progress', 'lifetime', 'max_lifetime',
+                 'max_shrink', 'rect')
     
     def __init__(self, arena_bounds, color=PULSE_WHITE):
         self.ax, self.ay, self.aw, self.ah = arena_bounds
@@ -214,6 +261,9 @@ class ArenaPulse:
         self.progress = 0.0
         self.lifetime = 20          # Shorter lifetime = snappier, less distracting
         self.max_lifetime = 20
+        # Collapse inward to ~40% of the arena's smaller dimension
+        self.max_shrink = min(self.aw, self.ah) / 2 * 0.40
+        self.rect = pygame.Rect(0, 0, 0, 0)    # Updated in place by draw()
     
     def update(self):
         """Progresses the pulse toward the center."""
@@ -229,10 +279,9 @@ class ArenaPulse:
         ox, oy = offset
         alpha = self.lifetime / self.max_lifetime
         
-        # Collapse inward to ~40% of the arena's smaller dimension
-        max_shrink = min(self.aw, self.ah) / 2 * 0.40
-        shrink = self.progress * max_shrink
-        pulse_rect = pygame.Rect(
+        shrink = self.progress * self.max_shrink
+        pulse_rect = self.rect
+        pulse_rect.update(
             int(self.ax + shrink + ox),
             int(self.ay + shrink + oy),
             int(self.aw - shrink * 2),
@@ -252,6 +301,9 @@ class ArenaPulseSystem:
     
     def __init__(self):
         self.pulses = []
+
+    def __len__(self):
+        return len(self.pulses)
     
     def add(self, arena_bounds, color=PULSE_WHITE):
         self.pulses.append(ArenaPulse(arena_bounds, color))
@@ -260,8 +312,15 @@ class ArenaPulseSystem:
         self.pulses = [p for p in self.pulses if p.update()]
     
     def draw(self, surface, offset=(0, 0)):
-        for p in self.pulses:
-            p.draw(surface, offset)
+        if not self.pulses:
+            return
+        # One explicit lock for the whole pass instead of one per primitive call
+        surface.lock()
+        try:
+            for p in self.pulses:
+                p.draw(surface, offset)
+        finally:
+            surface.unlock()
     
     def clear(self):
         self.pulses.clear()
@@ -280,6 +339,10 @@ class DamageNumber:
     to ensure legibility against any background while still communicating 
     attacker identity.
     """
+
+    __slots__ = ('x', 'y', 'damage', 'is_crit', 'color', 'outline_color', 'base_scale',
+                 'lifetime', 'max_lifetime', 'scale', 'vy',
+                 '_cached_base_surf', '_cached_outline_base_surf')
     
     def __init__(self, x: float, y: float, damage: float, color: tuple, is_crit: bool = False):
         self.x = x
@@ -294,6 +357,9 @@ class DamageNumber:
         self.max_lifetime = DAMAGE_NUMBER_LIFETIME
         self.scale = self.base_scale
         self.vy = -DAMAGE_NUMBER_SPEED
+        # Rendered on first draw, once the system's font is known
+        self._cached_base_surf = None
+        self._cached_outline_base_surf = None
     
     def update(self) -> bool:
         """Handles the 'pop' animation and upward drift."""
@@ -310,6 +376,22 @@ class DamageNumber:
         
         return self.lifetime > 0
     
+    def _make_surf(self, base_surf, alpha):
+        """Scales the base surface to the current pop scale and applies `alpha`.
+
+        At 1.0x the alpha is set on the base surface in place rather than on a
+        per-frame copy. Base surfaces may be shared between numbers, which is
+        safe because every caller sets the alpha immediately before blitting.
+        """
+        surf = base_surf
+        if self.scale != 1.0:
+            w = int(base_surf.get_width() * self.scale)
+            h = int(base_surf.get_height() * self.scale)
+            if w > 0 and h > 0:
+                surf = pygame.transform.scale(base_surf, (w, h))
+        surf.set_alpha(alpha)
+        return surf
+
     def draw(self, surface: pygame.Surface, offset: tuple, font: pygame.font.Font):
         """Renders the damage number with optional outline and scaling."""
         if self.lifetime <= 0:
@@ -317,37 +399,23 @@ class DamageNumber:
         
         ox, oy = offset
         alpha = min(255, int(255 * (self.lifetime / self.max_lifetime) * 1.5))
-        text = str(self.damage)
         cx = int(self.x + ox)
         cy = int(self.y + oy)
 
-        if not hasattr(self, '_cached_base_surf'):
+        if self._cached_base_surf is None:
+            text = str(self.damage)
             self._cached_base_surf = font.render(text, True, self.color)
             if self.outline_color is not None:
                 self._cached_outline_base_surf = font.render(text, True, self.outline_color)
 
-        def _make_surf(base_surf):
-            """Internal helper to scale and set alpha on the base surface."""
-            if self.scale != 1.0:
-                w = int(base_surf.get_width() * self.scale)
-                h = int(base_surf.get_height() * self.scale)
-                if w > 0 and h > 0:
-                    surf = pygame.transform.scale(base_surf, (w, h))
-                else:
-                    surf = base_surf
-            else:
-                surf = base_surf.copy()
-            surf.set_alpha(alpha)
-            return surf
-
         # Draw the outline for critical hits using multiple offset stamps
         if self.outline_color is not None:
-            outline_surf = _make_surf(self._cached_outline_base_surf)
-            for dx, dy in _OUTLINE_OFFSETS:
-                rect = outline_surf.get_rect(center=(cx + dx, cy + dy))
-                surface.blit(outline_surf, rect)
+            outline_surf = self._make_surf(self._cached_outline_base_surf, alpha)
+            rect = outline_surf.get_rect(center=(cx, cy))
+            surface.blits([(outline_surf, rect.move(dx, dy)) for dx, dy in _OUTLINE_OFFSETS],
+                          doreturn=False)
 
-        fill_surf = _make_surf(self._cached_base_surf)
+        fill_surf = self._make_surf(self._cached_base_surf, alpha)
         surface.blit(fill_surf, fill_surf.get_rect(center=(cx, cy)))
 
 
@@ -358,6 +426,13 @@ class DamageNumberSystem:
         self.numbers = []
         self.font = None
         self._crit_particles = ParticleSystem()
+        # (damage, color) -> rendered text, shared by every number showing that value.
+        # Damage values are small integers and colors come from the two fighters,
+        # so repeat hits reuse a surface instead of going through the font again.
+        self._glyph_cache = {}
+
+    def __len__(self):
+        return len(self.numbers) + len(self._crit_particles)
     
     def init_font(self):
         """Lazy-loads the font to prevent errors during early initialization."""
@@ -386,8 +461,10 @@ class DamageNumberSystem:
                 )
     
     def update(self):
-        self.numbers = [n for n in self.numbers if n.update()]
-        self._crit_particles.update()
+        if self.numbers:
+            self.numbers = [n for n in self.numbers if n.update()]
+        if self._crit_particles:
+            self._crit_particles.update()
     
     def draw(self, surface, offset=(0, 0)):
         """Renders all visual feedback elements."""
@@ -395,7 +472,19 @@ class DamageNumberSystem:
         # Draw particles behind text for clarity
         self._crit_particles.draw(surface, offset)
         for n in self.numbers:
+            if n._cached_base_surf is None:
+                n._cached_base_surf = self._glyph(n.damage, n.color)
+                if n.outline_color is not None:
+                    n._cached_outline_base_surf = self._glyph(n.damage, n.outline_color)
             n.draw(surface, offset, self.font)
+
+    def _glyph(self, damage, color):
+        """Returns the cached text surface for `damage` in `color`, rendering it on first use."""
+        key = (damage, color)
+        surf = self._glyph_cache.get(key)
+        if surf is None:
+            surf = self._glyph_cache[key] = self.font.render(str(damage), True, color)
+        return surf
     
     def clear(self):
         self.numbers.clear()
@@ -9,6 +9,7 @@ combat is driven by constant weapon rotation rather than manual inputs.
 import pygame
 import math
 import random
+from collections import deque
 
 from config import (
     WHITE, BLACK,
@@ -23,6 +24,10 @@ from config import (
 
 from renderers.fighter_renderer import FighterRenderer
 
+# Full turn in radians, used to wrap and cap the per-frame weapon rotation.
+TWO_PI = 2 * math.pi
+
+
 class Fighter:
     """Represents a combatant in the arena.
 
@@ -37,6 +42,29 @@ class Fighter:
         rotation_since_last_hit (float): Tracks angular distance to scale damage.
     """
 
+    # Fixed attribute layout: fighters are read and written every frame, and slots
+    # give faster attribute access and smaller instances than a per-instance dict.
+    __slots__ = (
+        # Physics
+        'x', 'y', 'start_x', 'start_y', 'vx', 'vy', 'radius', 'locked',
+        'speed_multiplier', 'weapon_speed_mult', 'victory_bounce',
+        # Identity / colors
+        'color', 'color_bright', 'is_blue',
+        'render_color', 'render_color_bright', 'health_bar_color',
+        # Weapon
+        'weapon', 'weapon_config', 'max_weapon_half_w', 'hit_ts', 'hit_half_ws',
+        'base_sword_length', 'sword_length', 'sword_angle', 'last_sword_angle',
+        'sword_angular_velocity', 'rotation_angle', 'rotation_since_last_hit',
+        'base_spin_speed', 'spin_speed', 'spin_direction',
+        # Combat state
+        'health', 'max_health', 'attack_cooldown', 'invincible', 'flash_timer',
+        'momentum', 'last_hit_frame',
+        'parry_energy', 'max_parry_energy', 'parry_cost', 'parry_cooldown',
+        'energy_regen_rate', 'guard_break_stun', 'regen_suppress_timer',
+        # Visuals
+        'trail', 'trail_length', 'sword_trail', '_renderer',
+    )
+
     def __init__(self, x: float, y: float, color: tuple, color_bright: tuple, is_blue: bool = True, weapon: str = "sword"):
         """Initializes the fighter with starting position and weapon archetype."""
         self.x = x
@@ -56,6 +84,12 @@ class Fighter:
         profile = self.weapon_config.get('hitbox_profile', [])
         self.max_weapon_half_w = max(hw for _, hw in profile) if profile else 0.0
 
+        # Blade samples past the handle, split into flat float tuples for the hit kernel
+        handle_ratio = self.weapon_config.get('handle_ratio', 0.25)
+        blade = [(float(t), float(hw)) for t, hw in profile if t >= handle_ratio]
+        self.hit_ts = tuple(t for t, _ in blade)
+        self.hit_half_ws = tuple(hw for _, hw in blade)
+
         # Health scaling based on weapon weight/archetype
         weapon_health = self.weapon_config.get('base_health', BASE_HEALTH)
         self.health = weapon_health
@@ -87,7 +121,7 @@ class Fighter:
         self.parry_energy = self.max_parry_energy
         self.energy_regen_rate = PARRY_REGEN_RATE
         self.parry_cost = float(PARRY_DRAIN_BASE)
-        self.sword_trail = []
+        self.sword_trail = deque(maxlen=5)     # Recent weapon tip positions
 
         # Guard break stun (weapon stops spinning, heavy drag applied)
         self.guard_break_stun = 0
@@ -113,7 +147,8 @@ class Fighter:
         # Operational state
         self.locked = False
         self.last_hit_frame = -100
-        self.trail = []
+        # Newest position first; the deque drops the oldest point on its own
+        self.trail = deque(maxlen=self.trail_length)
 
         self._renderer = FighterRenderer(weapon)
 
@@ -140,13 +175,13 @@ class Fighter:
         
         # Normalize angle to [-π, π] range
         if self.rotation_angle > math.pi:
-            self.rotation_angle -= 2 * math.pi
+            self.rotation_angle -= TWO_PI
         elif self.rotation_angle < -math.pi:
-            self.rotation_angle += 2 * math.pi
+            self.rotation_angle += TWO_PI
 
         # Accumulate rotation distance since last contact (capped at 2π)
         self.rotation_since_last_hit = min(
-            2 * math.pi, self.rotation_since_last_hit + abs(delta_rot)
+            TWO_PI, self.rotation_since_last_hit + abs(delta_rot)
         )
 
         self.sword_angle = self.rotation_angle
@@ -184,15 +219,13 @@ class Fighter:
             self.parry_energy = min(self.max_parry_energy, self.parry_energy + effective_regen)
 
         # Movement History (Visual Trail)
-        self.trail.insert(0, (self.x, self.y))
-        if len(self.trail) > self.trail_length:
-            self.trail.pop()
+        self.trail.appendleft((self.x, self.y))
 
         self.last_sword_angle = self.sword_angle
         self.update_rotation(opponent, 0)
         
         # Calculate angular velocity for collision impact calculations
-        delta = (self.sword_angle - self.last_sword_angle + math.pi) % (2 * math.pi) - math.pi
+        delta = (self.sword_angle - self.last_sword_angle + math.pi) % TWO_PI - math.pi
         self.sword_angular_velocity = delta
 
         # Timers
@@ -220,28 +253,33 @@ class Fighter:
             return
 
         # Normal Physics Update
-        self.vx *= DRAG
-        self.vy *= DRAG
+        # Position/velocity live in locals for the rest of the step and are written
+        # back once, instead of round-tripping through instance attributes per line.
+        x, y = self.x, self.y
+        vx = self.vx * DRAG
+        vy = self.vy * DRAG
 
         combined_mult = self.speed_multiplier * self.weapon_speed_mult
 
-        speed = math.hypot(self.vx, self.vy)
+        # Compare squared speeds; the sqrt is only paid when a clamp actually rescales
+        speed_sq = vx * vx + vy * vy
         max_vel = MAX_VELOCITY * combined_mult
-        if speed > max_vel:
-            self.vx = (self.vx / speed) * max_vel
-            self.vy = (self.vy / speed) * max_vel
-
         min_vel = MIN_VELOCITY * combined_mult
-        if speed < min_vel and speed > 0:
-            self.vx = (self.vx / speed) * min_vel
-            self.vy = (self.vy / speed) * min_vel
-        elif speed == 0:
-            a = random.uniform(0, 2 * math.pi)
-            self.vx = math.cos(a) * min_vel
-            self.vy = math.sin(a) * min_vel
-
-        self.x += self.vx
-        self.y += self.vy
+        if speed_sq > max_vel * max_vel:
+            scale = max_vel / math.sqrt(speed_sq)
+            vx *= scale
+            vy *= scale
+        elif speed_sq == 0:
+            a = random.uniform(0, TWO_PI)
+            vx = math.cos(a) * min_vel
+            vy = math.sin(a) * min_vel
+        elif speed_sq < min_vel * min_vel:
+            scale = min_vel / math.sqrt(speed_sq)
+            vx *= scale
+            vy *= scale
+
+        x += vx
+        y += vy
 
         # Wall Bounce & Ninja Boost Logic
         ax, ay, aw, ah = arena_bounds
@@ -250,55 +288,59 @@ class Fighter:
         cy = ay + ah / 2
 
         # Threshold below which wall hits are too gentle to warrant a sound.
-        _WALL_SOUND_SPEED_MIN = 6.0
+        _WALL_SOUND_SPEED_MIN_SQ = 6.0 * 6.0
         _hit_wall = False
-        _pre_bounce_speed = math.hypot(self.vx, self.vy)
+        _pre_bounce_speed_sq = vx * vx + vy * vy
 
         # Bounces apply a fixed BOUNCE_ENERGY multiplier and a WALL_BOOST_STRENGTH push
         # toward the center to keep fighters engaged in the middle of the arena.
-        if self.x - r < ax:
-            self.x = ax + r
-            self.vx = abs(self.vx) * BOUNCE_ENERGY
-            if self.x < cx: self.vx += WALL_BOOST_STRENGTH
-            if abs(self.vy) < 0.5:
-                self.vy += random.uniform(-0.5, 0.5) or 0.3
+        if x - r < ax:
+            x = ax + r
+            vx = abs(vx) * BOUNCE_ENERGY
+            if x < cx: vx += WALL_BOOST_STRENGTH
+            if abs(vy) < 0.5:
+                vy += random.uniform(-0.5, 0.5) or 0.3
             _hit_wall = True
-        if self.x + r > ax + aw:
-            self.x = ax + aw - r
-            self.vx = -abs(self.vx) * BOUNCE_ENERGY
-            if self.x > cx: self.vx -= WALL_BOOST_STRENGTH
-            if abs(self.vy) < 0.5:
-                self.vy += random.uniform(-0.5, 0.5) or 0.3
+        if x + r > ax + aw:
+            x = ax + aw - r
+            vx = -abs(vx) * BOUNCE_ENERGY
+            if x > cx: vx -= WALL_BOOST_STRENGTH
+            if abs(vy) < 0.5:
+                vy += random.uniform(-0.5, 0.5) or 0.3
             _hit_wall = True
-        if self.y - r < ay:
-            self.y = ay + r
-            self.vy = abs(self.vy) * BOUNCE_ENERGY
-            if self.y < cy: self.vy += WALL_BOOST_STRENGTH
-            if abs(self.vx) < 0.5:
-                self.vx += random.uniform(-0.5, 0.5) or 0.3
+        if y - r < ay:
+            y = ay + r
+            vy = abs(vy) * BOUNCE_ENERGY
+            if y < cy: vy += WALL_BOOST_STRENGTH
+            if abs(vx) < 0.5:
+                vx += random.uniform(-0.5, 0.5) or 0.3
             _hit_wall = True
-        if self.y + r > ay + ah:
-            self.y = ay + ah - r
-            self.vy = -abs(self.vy) * BOUNCE_ENERGY
-            if self.y > cy: self.vy -= WALL_BOOST_STRENGTH
-            if abs(self.vx) < 0.5:
-                self.vx += random.uniform(-0.5, 0.5) or 0.3
+        if y + r > ay + ah:
+            y = ay + ah - r
+            vy = -abs(vy) * BOUNCE_ENERGY
+            if y > cy: vy -= WALL_BOOST_STRENGTH
+            if abs(vx) < 0.5:
+                vx += random.uniform(-0.5, 0.5) or 0.3
             _hit_wall = True
 
+        self.x, self.y = x, y
+        self.vx, self.vy = vx, vy
+
         # Wall Bounce Sparks — visual only, no audio.
         # Sparks are emitted at the wall contact point so they read as friction/impact
         # rather than spawning from the fighter body centre.
-        if _hit_wall and _pre_bounce_speed > _WALL_SOUND_SPEED_MIN:
+        if _hit_wall and _pre_bounce_speed_sq > _WALL_SOUND_SPEED_MIN_SQ:
             spark_count = random.randint(5, 6)
+            color = self.color
             # Determine the contact point on whichever wall(s) were just hit
-            if self.x - r <= ax + 1:             # left wall
-                particles.emit(ax, self.y, self.color, count=spark_count, size=3, lifetime=18)
-            elif self.x + r >= ax + aw - 1:      # right wall
-                particles.emit(ax + aw, self.y, self.color, count=spark_count, size=3, lifetime=18)
-            if self.y - r <= ay + 1:             # top wall
-                particles.emit(self.x, ay, self.color, count=spark_count, size=3, lifetime=18)
-            elif self.y + r >= ay + ah - 1:      # bottom wall
-                particles.emit(self.x, ay + ah, self.color, count=spark_count, size=3, lifetime=18)
+            if x - r <= ax + 1:             # left wall
+                particles.emit(ax, y, color, count=spark_count, size=3, lifetime=18)
+            elif x + r >= ax + aw - 1:      # right wall
+                particles.emit(ax + aw, y, color, count=spark_count, size=3, lifetime=18)
+            if y - r <= ay + 1:             # top wall
+                particles.emit(x, ay, color, count=spark_count, size=3, lifetime=18)
+            elif y + r >= ay + ah - 1:      # bottom wall
+                particles.emit(x, ay + ah, color, count=spark_count, size=3, lifetime=18)
 
         if self.victory_bounce > 0:
             self.victory_bounce -= 1
@@ -311,11 +353,14 @@ class Fighter:
         Returns:
             A tuple of ((base_x, base_y), (tip_x, tip_y)).
         """
-        r = self.radius
-        base_x = self.x + math.cos(self.sword_angle) * (r + 3)
-        base_y = self.y + math.sin(self.sword_angle) * (r + 3)
-        tip_x = base_x + math.cos(self.sword_angle) * self.sword_length
-        tip_y = base_y + math.sin(self.sword_angle) * self.sword_length
+        # One cos/sin pair serves both the base and the tip (same direction)
+        cos_a = math.cos(self.sword_angle)
+        sin_a = math.sin(self.sword_angle)
+        reach = self.radius + 3
+        base_x = self.x + cos_a * reach
+        base_y = self.y + sin_a * reach
+        tip_x = base_x + cos_a * self.sword_length
+        tip_y = base_y + sin_a * self.sword_length
         return (base_x, base_y), (tip_x, tip_y)
 
 
@@ -380,7 +425,7 @@ class Fighter:
         self.speed_multiplier = 1.0     # reset chaos override
         self.parry_cooldown = 0
         self.parry_energy = self.max_parry_energy
-        self.sword_trail = []
+        self.sword_trail.clear()
 
         self.guard_break_stun = 0
         self.regen_suppress_timer = 0
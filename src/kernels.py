@@ -0,0 +1,81 @@
+"""
+Numeric kernels for the per-frame hot paths of the AlgoRot simulation.
+
+The functions in this module are plain scalar math written so that Numba
+can compile them to native code. When Numba is installed they are JIT
+compiled with an on-disk cache (so the compile cost is paid once per
+install, not once per match subprocess). When it is missing, the same
+functions run as regular Python, so the simulation never depends on it.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is unavailable."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Returned as damage_t when no profile sample touches the defender.
+NO_HIT = -1.0
+
+
+@njit(cache=True, fastmath=True)
+def profile_hit(base_x, base_y, tip_x, tip_y, def_x, def_y, def_r, ts, half_ws, max_half_w):
+    """Tests a weapon's hitbox profile against a defender's body circle.
+
+    Args:
+        base_x, base_y: World position of the weapon handle (body edge).
+        tip_x, tip_y:   World position of the weapon tip.
+        def_x, def_y:   Defender center.
+        def_r:          Defender body radius.
+        ts:             Profile sample positions along the blade [0.0, 1.0],
+                        already filtered to exclude the handle.
+        half_ws:        Cross-section half-width for each sample in `ts`.
+        max_half_w:     Largest value in `half_ws`, used for the early reject.
+
+    Returns:
+        A tuple of (damage_t, spawn_x, spawn_y). damage_t is the handle-most
+        sample that hit, or NO_HIT; spawn_x/spawn_y is the tip-most hit point.
+    """
+    seg_x = tip_x - base_x
+    seg_y = tip_y - base_y
+
+    # Early reject: every sample lies on the base->tip segment, so if the closest
+    # point of the whole segment is out of reach, no sample can hit either.
+    seg_len_sq = seg_x * seg_x + seg_y * seg_y
+    t_near = 0.0
+    if seg_len_sq > 0.0:
+        t_near = ((def_x - base_x) * seg_x + (def_y - base_y) * seg_y) / seg_len_sq
+        t_near = min(1.0, max(0.0, t_near))
+    nx = base_x + seg_x * t_near - def_x
+    ny = base_y + seg_y * t_near - def_y
+    reach = max_half_w + def_r
+    if nx * nx + ny * ny >= reach * reach:
+        return NO_HIT, 0.0, 0.0
+
+    damage_t = NO_HIT
+    spawn_t  = NO_HIT
+    spawn_x  = 0.0
+    spawn_y  = 0.0
+
+    for i in range(len(ts)):
+        t = ts[i]
+        px = base_x + seg_x * t
+        py = base_y + seg_y * t
+        dx = px - def_x
+        dy = py - def_y
+        limit = half_ws[i] + def_r
+        if dx * dx + dy * dy < limit * limit:
+            # damage_t is taken from the handle-most point for consistency
+            if damage_t < 0.0 or t < damage_t:
+                damage_t = t
+            # spawn_pos is taken from the tip-most point for better visual impact
+            if t > spawn_t:
+                spawn_t = t
+                spawn_x = px
+                spawn_y = py
+
+    return damage_t, spawn_x, spawn_y
@@ -37,9 +37,9 @@ from config import (
     WHITE, PURPLE, BLACK, ARENA_BG, DARK_GRAY, GRAY, YELLOW, PULSE_WHITE,
     ARENA_MARGIN, ARENA_WIDTH, ARENA_HEIGHT,
     ROUND_MAX_TIME, BASE_KNOCKBACK, DAMAGE_PER_HIT, SLOW_MOTION_SPEED,
-    HIT_STOP_FRAMES, SCREEN_SHAKE_INTENSITY, SCREEN_SHAKE_DECAY,
+    HIT_STOP_FRAMES, SCREEN_SHAKE_INTENSITY, SCREEN_SHAKE_DECAY, SHAKE_NOISE_SIZE,
     HIT_SLOWMO_FRAMES, HIT_SLOWMO_TIMESCALE,
-    INACTIVITY_PULSE_TIME, ARENA_PULSE_VELOCITY_BOOST,
+    INACTIVITY_PULSE_FRAMES, ARENA_PULSE_VELOCITY_BOOST,
     ARENA_PULSE_SHAKE,
     NEON_BG, NEON_GRID,
     CRIT_CHANCE, CRIT_MULTIPLIER, CRIT_IMPACT_FRAMES, CRIT_IMPACT_TIMESCALE
@@ -66,6 +66,9 @@ class Game:
         combat_manager (CombatManager): Handles collision detection/resolution.
         ui_renderer (UIRenderer): Manages the Tekken-style HUD and victory screens.
     """
+    # Off-screen border around the pre-rendered grid so shake never exposes an edge.
+    GRID_MARGIN = 120
+
     def __init__(self, f1_color, f2_color, f1_name="Blue", f2_name="Red", f1_weapon="sword", f2_weapon="sword"):
         import sys
         self.is_test_mode = "--test-mode" in sys.argv
@@ -88,6 +91,14 @@ class Game:
         self.window = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT), flags)
         self.canvas = pygame.Surface((CANVAS_WIDTH, CANVAS_HEIGHT))
         self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # The letterbox bands around the screen never change; only the screen
+        # area is overwritten each frame, so the canvas is filled once here.
+        self.canvas.fill((15, 15, 15))
+        self._canvas_y_offset = (CANVAS_HEIGHT - SCREEN_HEIGHT) // 2
+        # smoothscale can write straight into the window when pixel sizes match,
+        # skipping a fresh full-size Surface allocation every frame.
+        window_bpp = self.window.get_bytesize()
+        self._scale_into_window = window_bpp in (3, 4) and self.canvas.get_bytesize() == window_bpp
         pygame.display.set_caption("Red vs Blue Battle - YT Shorts Edition")
         self.clock = pygame.time.Clock()
 
@@ -105,6 +116,8 @@ class Game:
         # Define the base arena square.
         self.base_arena = (ARENA_MARGIN, ARENA_MARGIN, ARENA_WIDTH, ARENA_HEIGHT)
         self.arena_bounds = list(self.base_arena)
+        self._effective_arena = tuple(self.arena_bounds)   # shared by update() and draw()
+        self._arena_rect = pygame.Rect(0, 0, 0, 0)         # reused by _draw_arena() each frame
         
         # Use neon colors for fighters
         # Spawn 60-70% in from their edges so weapons nearly touch at center
@@ -115,6 +128,7 @@ class Game:
                             self.f1_color, self.f1_bright, is_blue=True, weapon=f1_weapon)
         self.red = Fighter(SCREEN_WIDTH - ARENA_MARGIN - spawn_inset, center_y, 
                             self.f2_color, self.f2_bright, is_blue=False, weapon=f2_weapon)
+        self._fighters = (self.blue, self.red)
         
         # Lock fighters for countdown
         self._lock_fighters_for_countdown()
@@ -128,6 +142,10 @@ class Game:
         # Screen effects.
         self.screen_shake = 0
         self.hit_stop = 0
+
+        # Per-axis uniform offsets in [-1, 1], drawn once and cycled so draw() never hits the RNG
+        self._shake_noise = [(random.uniform(-1, 1), random.uniform(-1, 1)) for _ in range(SHAKE_NOISE_SIZE)]
+        self._shake_idx = 0
         self.hit_slowmo_frames = 0
         self.hit_slowmo_accumulator = 0.0
         
@@ -190,7 +208,7 @@ class Game:
         self._wipe_surf.fill(WHITE)
 
         # Pre-render grid background with a margin (to support screen shake)
-        margin = 120
+        margin = self.GRID_MARGIN
         self.grid_surf = pygame.Surface((SCREEN_WIDTH + margin * 2, SCREEN_HEIGHT + margin * 2))
         self.grid_surf.fill(NEON_BG)
         grid_spacing = 40
@@ -208,14 +226,21 @@ class Game:
             new_size = (int(logo_img.get_width() * scale_factor), int(logo_img.get_height() * scale_factor))
             self.bg_logo = pygame.transform.scale(logo_img, new_size)
             self.bg_logo.set_alpha(60) 
+            # The watermark always sits on the flat arena fill, so pre-blend it onto
+            # ARENA_BG once; drawing it is then an opaque copy, not a per-pixel alpha blend.
+            self._bg_logo_baked = pygame.Surface(new_size).convert()
+            self._bg_logo_baked.fill(ARENA_BG)
+            self._bg_logo_baked.blit(self.bg_logo, (0, 0))
         except Exception as e:
             print(f"Failed to load background logo: {e}")
             self.bg_logo = None
+            self._bg_logo_baked = None
         
         # Main Component Managers
         self.obs_manager = OBSManager(self.f1_name, self.f2_name)
         self.obs_manager.connect()
         self.combat_manager = CombatManager()
+        self.combat_manager.warm_up(self._fighters)   # keep JIT work out of recorded frames
         self.ui_renderer = UIRenderer(self.screen, self.font_medium, self.font_small)
         
         # Intro and Outro Renderers
@@ -268,9 +293,6 @@ class Game:
         self._trigger_arena_pulse()     # Trigger the visual and audio pulse effect
         
         # Launch directly at each other — close spawn means first clash is near-instant
-        from config import SCREEN_WIDTH, SCREEN_HEIGHT
-        import math
-        
         center_x = SCREEN_WIDTH // 2
         center_y = SCREEN_HEIGHT // 2
 
@@ -297,7 +319,7 @@ class Game:
 
     def _trigger_arena_pulse(self):
         """Trigger Arena Pulse."""
-        self.arena_pulses.add(tuple(self.arena_bounds), PULSE_WHITE)
+        self.arena_pulses.add(self._effective_arena, PULSE_WHITE)
         self.screen_shake = ARENA_PULSE_SHAKE
         
         # Play arena pulse sound
@@ -307,14 +329,14 @@ class Game:
         center_x = SCREEN_WIDTH // 2
         center_y = SCREEN_HEIGHT // 2
         
-        for fighter in [self.blue, self.red]:
+        for fighter in self._fighters:
             dx = center_x - fighter.x
             dy = center_y - fighter.y
             dist = max(1, math.hypot(dx, dy))
             fighter.vx += (dx / dist) * ARENA_PULSE_VELOCITY_BOOST
             fighter.vy += (dy / dist) * ARENA_PULSE_VELOCITY_BOOST
-            speed = math.hypot(fighter.vx, fighter.vy)
-            if speed > 0:
+            # Only "is it moving at all" matters here, so skip the magnitude entirely
+            if fighter.vx or fighter.vy:
                 fighter.vx *= 1.2
                 fighter.vy *= 1.2
 
@@ -513,8 +535,10 @@ class Game:
         # content duplication across batch recording sessions.
         if not self.is_test_mode:
             tracker_data[category].append(chosen_index)
-            with open(tracker_file, 'w') as f:
+            tmp_file = tracker_file + ".tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(tracker_data, f, indent=4)
+            os.replace(tmp_file, tracker_file)
             
 
     def _reset_round(self):
@@ -522,6 +546,7 @@ class Game:
         self.blue.reset()
         self.red.reset()
         self.arena_bounds = list(self.base_arena)
+        self._effective_arena = tuple(self.arena_bounds)
         self.round_ending = False
         self.winner = None
         self.winner_text = ""
@@ -574,7 +599,7 @@ class Game:
 
     def _snap_fighters_to_intro(self):
         """Silently teleport both fighters back to spawn under the solid-white frame."""
-        for f in [self.blue, self.red]:
+        for f in self._fighters:
             f.x, f.y = f.start_x, f.start_y
             f.vx = f.vy = 0
             f.health = f.max_health  # full bars match the intro state
@@ -689,8 +714,8 @@ class Game:
             self.decomp_slowmo_accumulator += 0.10
             self.decomp_slowmo_frames -= 1
             if self.decomp_slowmo_accumulator < 1.0:
-                self.particles.update()
-                self.damage_numbers.update()
+                if self.particles: self.particles.update()
+                if self.damage_numbers: self.damage_numbers.update()
                 return
             self.decomp_slowmo_accumulator -= 1.0
         
@@ -750,9 +775,9 @@ class Game:
 
             # Stop updating effects once wipe has started — kills the lingering particle bug
             if not self.loop_wipe_is_closing:
-                self.particles.update()
-                self.shockwaves.update()
-                self.arena_pulses.update()
+                if self.particles: self.particles.update()
+                if self.shockwaves: self.shockwaves.update()
+                if self.arena_pulses: self.arena_pulses.update()
             return
         
         self.round_timer += 1
@@ -760,33 +785,39 @@ class Game:
 
         # Arena Escalation (Repeating Pulse)
         self.inactivity_timer += 1
-        if self.inactivity_timer >= INACTIVITY_PULSE_TIME * FPS:
+        if self.inactivity_timer >= INACTIVITY_PULSE_FRAMES:
             self._trigger_arena_pulse()
             self.inactivity_timer = 0  # Reset so it pulses again in 2 seconds if still inactive
         
-        effective_arena = tuple(self.arena_bounds)
+        # arena_bounds only changes in __init__/_reset_round, which rebuild this tuple
+        effective_arena = self._effective_arena
+
+        # Per-frame fast path: bind the hot objects once as locals
+        blue, red = self.blue, self.red
+        particles, shockwaves = self.particles, self.shockwaves
 
         # Update fighters with effective arena (pass sound_manager for wall-bounce audio)
         sm = getattr(self, 'sound_manager', None)
-        self.blue.update(self.red, effective_arena, self.particles, self.shockwaves, sm)
-        self.red.update(self.blue, effective_arena, self.particles, self.shockwaves, sm)
+        blue.update(red, effective_arena, particles, shockwaves, sm)
+        red.update(blue, effective_arena, particles, shockwaves, sm)
     
-        self.combat_manager.handle_collisions(self.blue, self.red, self)
+        self.combat_manager.handle_collisions(blue, red, self)
         
-        self.particles.update()
-        self.shockwaves.update()
-        self.arena_pulses.update()
-        self.damage_numbers.update()
+        # Effect systems are falsy when empty, so idle frames skip the update call
+        if particles: particles.update()
+        if shockwaves: shockwaves.update()
+        if self.arena_pulses: self.arena_pulses.update()
+        if self.damage_numbers: self.damage_numbers.update()
         
         # Lead tracking
-        blue_pct = self.blue.health / max(1, self.blue.max_health)
-        red_pct = self.red.health / max(1, self.red.max_health)
+        blue_pct = blue.health / max(1, blue.max_health)
+        red_pct = red.health / max(1, red.max_health)
         
         if blue_pct > red_pct:
-            leader = self.blue
+            leader = blue
             self.max_blue_lead = max(self.max_blue_lead, blue_pct - red_pct)
         elif red_pct > blue_pct:
-            leader = self.red
+            leader = red
             self.max_red_lead = max(self.max_red_lead, red_pct - blue_pct)
         else:
             leader = None
@@ -796,18 +827,17 @@ class Game:
                 self.lead_changes += 1
             self.current_leader = leader
         
-        if self.blue.health <= 0:
-            self._end_round(winner=self.red, loser=self.blue)
-        elif self.red.health <= 0:
-            self._end_round(winner=self.blue, loser=self.red)
+        if blue.health <= 0:
+            self._end_round(winner=red, loser=blue)
+        elif red.health <= 0:
+            self._end_round(winner=blue, loser=red)
 
 
     def draw(self):
         """Draw coordinator. Each section is isolated — edit one without touching others."""
         offset = self._compute_shake_offset()
 
-        ox, oy = offset
-        self.screen.blit(self.grid_surf, (ox - 120, oy - 120))
+        self._draw_grid(offset)
         self._draw_arena(offset)
         self._draw_effects(offset)
         self._draw_fighters(offset)
@@ -933,21 +963,24 @@ class Game:
 
 
     def _compute_shake_offset(self) -> tuple:
-        if getattr(self, 'fight_punch_frame', False):
-            punch = SCREEN_SHAKE_INTENSITY * 7
+        if self.fight_punch_frame:
+            magnitude = SCREEN_SHAKE_INTENSITY * 7
             self.fight_punch_frame = False
-            return (random.uniform(-punch, punch), random.uniform(-punch, punch))
         elif self.screen_shake > 0:
-            return (random.uniform(-self.screen_shake, self.screen_shake),
-                    random.uniform(-self.screen_shake, self.screen_shake))
-        return (0, 0)
+            magnitude = self.screen_shake
+        else:
+            return (0, 0)
+        nx, ny = self._shake_noise[self._shake_idx & (SHAKE_NOISE_SIZE - 1)]
+        self._shake_idx += 1
+        return (nx * magnitude, ny * magnitude)
 
 
     def _draw_arena(self, offset):
         """Arena background, logo watermark, and momentum border."""
-        ax, ay, aw, ah = self.arena_bounds
+        ax, ay, aw, ah = self._effective_arena
         ox, oy = offset
-        arena_rect = pygame.Rect(int(ax + ox), int(ay + oy), int(aw), int(ah))
+        arena_rect = self._arena_rect
+        arena_rect.update(int(ax + ox), int(ay + oy), int(aw), int(ah))
 
         pygame.draw.rect(self.screen, ARENA_BG, arena_rect)
 
@@ -955,7 +988,11 @@ class Game:
             logo_rect = self.bg_logo.get_rect(
                 center=(int(ax + aw / 2 + ox), int(ay + ah / 2 + oy))
             )
-            self.screen.blit(self.bg_logo, logo_rect)
+            # Fall back to the live blend if a shrunken arena no longer covers the logo
+            if arena_rect.contains(logo_rect):
+                self.screen.blit(self._bg_logo_baked, logo_rect)
+            else:
+                self.screen.blit(self.bg_logo, logo_rect)
 
         # Skip momentum color until combat starts (keeps it neutral until the first hit)
         if self.round_timer == 0:
@@ -993,19 +1030,18 @@ class Game:
 
     def _draw_fighters(self, offset):
         """Fighter draw routing based on round state."""
-        if not self.round_ending:
-            self.blue.draw(self.screen, offset)
-            self.red.draw(self.screen, offset)
-        elif self.loop_wipe_phase == 3 or self.loop_wipe_done:
-            # Wipe is pulling back — reveal fighters at intro positions
-            self.blue.draw(self.screen, offset)
-            self.red.draw(self.screen, offset)
+        screen = self.screen
+        # Both fighters are visible mid-round, and again once the wipe is pulling
+        # back to reveal them at intro positions.
+        if not self.round_ending or self.loop_wipe_phase == 3 or self.loop_wipe_done:
+            self.blue.draw(screen, offset)
+            self.red.draw(screen, offset)
         elif self.reset_timer > 55:
             winner = self.winner
             if winner:
-                winner.draw(self.screen, offset)
-        self.particles.draw(self.screen, offset)
-        self.damage_numbers.draw(self.screen, offset)
+                winner.draw(screen, offset)
+        self.particles.draw(screen, offset)
+        self.damage_numbers.draw(screen, offset)
 
 
     def _draw_crit_flash(self):
@@ -1018,28 +1054,39 @@ class Game:
 
     def _present_to_window(self):
         """Canvas scaling and final display flip. Always the last draw call."""
-        self.canvas.fill((15, 15, 15))
-        y_offset = (CANVAS_HEIGHT - SCREEN_HEIGHT) // 2
-        self.canvas.blit(self.screen, (0, y_offset))
-        scaled_preview = pygame.transform.smoothscale(self.canvas, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
-        self.window.blit(scaled_preview, (0, 0))
+        self.canvas.blit(self.screen, (0, self._canvas_y_offset))
+        if self._scale_into_window:
+            pygame.transform.smoothscale(self.canvas, (DISPLAY_WIDTH, DISPLAY_HEIGHT), self.window)
+        else:
+            scaled_preview = pygame.transform.smoothscale(self.canvas, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+            self.window.blit(scaled_preview, (0, 0))
         pygame.display.flip()
     
 
     def _draw_grid(self, offset):
-        """Draw faint grid for cyberpunk aesthetic."""
+        """Background fill + faint cyberpunk grid, blitted from the pre-rendered surface."""
         ox, oy = offset
-        grid_spacing = 40
-        
-        for x in range(0, SCREEN_WIDTH + grid_spacing, grid_spacing):
-            pygame.draw.line(self.screen, NEON_GRID, 
-                           (int(x + ox), 0), (int(x + ox), SCREEN_HEIGHT), 1)
-        
-        for y in range(0, SCREEN_HEIGHT + grid_spacing, grid_spacing):
-            pygame.draw.line(self.screen, NEON_GRID,
-                           (0, int(y + oy)), (SCREEN_WIDTH, int(y + oy)), 1)
+        self.screen.blit(self.grid_surf, (int(ox) - self.GRID_MARGIN, int(oy) - self.GRID_MARGIN))
     
 
+    def _start_from_title(self):
+        """Leave the title screen and start the match with OBS recording."""
+        self.game_state = 'PLAYING'
+        self.obs_manager.start_recording()  # Start OBS
+        self.recording_start_time = time.time()
+        self.obs_startup_timer = 60  # Delay on start
+
+    def _on_space_pressed(self):
+        """SPACE starts the match from the title screen, otherwise toggles pause."""
+        if self.game_state == 'TITLE':
+            self._start_from_title()
+        else:
+            self.paused = not self.paused
+
+    def _delay_obs_start(self):
+        """Manual delay: re-arm the OBS startup timer."""
+        self.obs_startup_timer = 60
+
     def run(self):
         """Main loop."""
         import sys
@@ -1052,49 +1099,49 @@ class Game:
         elif "--test-mode" in sys.argv:
             self.game_state = 'PLAYING'
 
+        # Block every event type, then re-allow only the three the loop handles.
+        # Mouse motion, key-ups and window events are dropped at the SDL queue, so
+        # they are never converted to Python objects and nothing has to be cleared.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
+        # KEYDOWN dispatch: one dict lookup per key press instead of an elif chain.
+        key_handlers = {
+            pygame.K_SPACE: self._on_space_pressed,
+            pygame.K_m:     self._delay_obs_start,
+            pygame.K_r:     self._reset_round,
+        }
+        is_headless = getattr(self, 'is_headless', False)
+
         running = True
         while running:
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
+                if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
-                    elif event.key == pygame.K_SPACE:
-                        if self.game_state == 'TITLE':
-                            self.game_state = 'PLAYING'
-                            self.obs_manager.start_recording()  # Start OBS
-                            self.recording_start_time = time.time()
-                            self.obs_startup_timer = 60  # Delay on start
-                        else:
-                            self.paused = not self.paused
-                    elif event.key == pygame.K_m:
-                        # Manual delay
-                        self.obs_startup_timer = 60
-                    elif event.key == pygame.K_r:
-                        self._reset_round()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.game_state == 'TITLE':
-                        self.game_state = 'PLAYING'
-                        self.obs_manager.start_recording()  # Start OBS
-                        self.recording_start_time = time.time()
-                        self.obs_startup_timer = 60  # Delay on start
+                    else:
+                        handler = key_handlers.get(event.key)
+                        if handler is not None:
+                            handler()
+                elif event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.MOUSEBUTTONDOWN and self.game_state == 'TITLE':
+                    self._start_from_title()
             
             if self.game_state == 'TITLE':
-                if not getattr(self, 'is_headless', False):
+                if not is_headless:
                     should_start = self.intro_renderer.draw_title()
                     self._present_to_window()          # always scale + flip after any draw
                     if should_start:
-                        self.game_state = 'PLAYING'
-                        self.obs_manager.start_recording()
-                        self.recording_start_time = time.time()
-                        self.obs_startup_timer = 60
+                        self._start_from_title()
             else:
                 self.update()
-                if not getattr(self, 'is_headless', False):
+                # Paused frames change nothing, so the last presented frame stays up
+                # and the loop only ticks the clock instead of re-rendering it.
+                if not is_headless and not self.paused:
                     self.draw()
             
-            if not getattr(self, 'is_headless', False):
+            if not is_headless:
                 self.clock.tick(FPS)
         
         # Stop OBS before shutting down entirely
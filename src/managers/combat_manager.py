@@ -19,6 +19,7 @@ from config import (
     GUARD_BREAK_HIT_STOP, GUARD_BREAK_DAMAGE_MIN, GUARD_BREAK_DAMAGE_MAX,
     GUARD_BREAK_SCREEN_SHAKE
 )
+from kernels import profile_hit, NO_HIT
 
 class CombatManager:
     """Orchestrates combat logic and physical resolutions.
@@ -32,6 +33,24 @@ class CombatManager:
         """Initializes the CombatManager."""
         pass
 
+    def warm_up(self, fighters):
+        """Compiles (or loads from cache) the hit kernel for this matchup up front.
+
+        Numba specializes profile_hit per profile length and argument types, and
+        otherwise does that work on the first in-reach frame, i.e. the opening
+        clash of a match OBS is already recording. Each attacker's real profile
+        tuples and the defender's real radius type are used so the signatures
+        match the calls made by _check_sword_hit.
+        """
+        blue, red = fighters
+        for attacker, defender in ((blue, red), (red, blue)):
+            if attacker.hit_ts:
+                profile_hit(
+                    0.0, 0.0, 1.0, 0.0,
+                    0.0, 0.0, defender.radius,
+                    attacker.hit_ts, attacker.hit_half_ws, attacker.max_weapon_half_w,
+                )
+
     def _check_sword_hit(self, attacker, defender) -> tuple:
         """Performs profile-based hitbox detection for a weapon.
 
@@ -49,11 +68,7 @@ class CombatManager:
                 spawn_pos: World coordinates (x, y) of the hit for visual effects.
                 damage_t: Normalized position [0.0, 1.0] along the blade length.
         """
-        cfg = attacker.weapon_config
-        profile      = cfg.get('hitbox_profile', [])
-        handle_ratio = cfg.get('handle_ratio', 0.25)
-
-        if not profile:
+        if not attacker.hit_ts:
             return None, 0.0
 
         # Spatial partitioning: quick distance check before expensive profile sampling
@@ -67,32 +82,19 @@ class CombatManager:
 
         (base_x, base_y), (tip_x, tip_y) = attacker.get_sword_hitbox()
 
-        best_damage_t  = None
-        best_spawn_t   = None
-        best_spawn_pos = None
-
-        # Sample the weapon profile to find the most favorable hit point
-        for (t, half_w) in profile:
-            if t < handle_ratio:
-                continue
-
-            px = base_x + (tip_x - base_x) * t
-            py = base_y + (tip_y - base_y) * t
-
-            dx = px - defender.x
-            dy = py - defender.y
-            dist_sq = dx * dx + dy * dy
-            limit = half_w + defender.radius
-            if dist_sq < limit * limit:
-                # damage_t is taken from the handle-most point for consistency
-                if best_damage_t is None or t < best_damage_t:
-                    best_damage_t = t
-                # spawn_pos is taken from the tip-most point for better visual impact
-                if best_spawn_t is None or t > best_spawn_t:
-                    best_spawn_t = t
-                    best_spawn_pos = (px, py)
-
-        return (best_spawn_pos, best_damage_t) if best_spawn_pos else (None, 0.0)
+        # Sample the weapon profile to find the most favorable hit point.
+        # Positions are passed as floats: fighters can sit on integer coordinates
+        # (spawn, wall clamps), and each int/float mix would be a separate JIT
+        # specialization compiled mid-match instead of by warm_up().
+        damage_t, spawn_x, spawn_y = profile_hit(
+            base_x, base_y, tip_x, tip_y,
+            float(defender.x), float(defender.y), defender.radius,
+            attacker.hit_ts, attacker.hit_half_ws, max_half_w,
+        )
+
+        if damage_t == NO_HIT:
+            return None, 0.0
+        return (spawn_x, spawn_y), damage_t
 
 
     @staticmethod
@@ -239,8 +241,11 @@ class CombatManager:
                     self._apply_guard_break(broken, breaker, ix_point, game)
 
         # === BODY HIT CHECK (Act 3) ===
-        pairs = [(blue, red), (red, blue)]
-        random.shuffle(pairs)
+        # Coin-flip who strikes first instead of shuffling a fresh list each frame
+        if random.random() < 0.5:
+            pairs = ((blue, red), (red, blue))
+        else:
+            pairs = ((red, blue), (blue, red))
 
         for attacker, defender in pairs:
             hit_pos, impact_ratio = self._check_sword_hit(attacker, defender)
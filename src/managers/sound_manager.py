@@ -59,8 +59,11 @@ WEAPON_PITCH_MODIFIERS: dict[str, float] = {
 def _compute_rms(snd) -> float:
     """Return the RMS amplitude of a pygame Sound object."""
     try:
-        samples = pygame.sndarray.array(snd).astype(np.float32)
-        rms = float(np.sqrt(np.mean(samples ** 2)))
+        # One float32 copy (like the rest of this module), then the sum of squares
+        # in a single pass with a float64 accumulator and no squared temporary.
+        samples = pygame.sndarray.array(snd).astype(np.float32).ravel()
+        sum_sq = np.einsum('i,i->', samples, samples, dtype=np.float64)
+        rms = float(np.sqrt(sum_sq / max(1, samples.size)))
         return rms if rms > 0 else 1.0
     except Exception:
         return 1.0
@@ -88,23 +91,25 @@ def _pitch_shift_sound(snd, ratio: float) -> pygame.mixer.Sound:
         original_len = arr.shape[0]
         new_len = max(1, int(round(original_len / ratio)))
 
-        if arr.ndim == 1:
-            # Mono
-            x_old = np.linspace(0, 1, original_len)
-            x_new = np.linspace(0, 1, new_len)
-            shifted = np.interp(x_new, x_old, arr.astype(np.float32))
-            shifted = np.clip(shifted, -32768, 32767).astype(arr.dtype)
-        else:
-            # Stereo / multi-channel
-            channels = arr.shape[1]
-            x_old = np.linspace(0, 1, original_len)
-            x_new = np.linspace(0, 1, new_len)
-            shifted_channels = [
-                np.interp(x_new, x_old, arr[:, c].astype(np.float32))
-                for c in range(channels)
-            ]
-            shifted = np.stack(shifted_channels, axis=1)
-            shifted = np.clip(shifted, -32768, 32767).astype(arr.dtype)
+        # Linear resample by direct index arithmetic: output sample k sits at
+        # fractional source position k * step, so no sample grids are built and
+        # no per-sample search is needed. All channels are interpolated at once
+        # (mono is treated as a single column).
+        src = arr.reshape(original_len, -1)
+        step = (original_len - 1) / (new_len - 1) if new_len > 1 else 0.0
+        pos = np.arange(new_len) * step
+        i0 = np.minimum(pos.astype(np.intp), max(0, original_len - 2))
+        i1 = np.minimum(i0 + 1, original_len - 1)
+        # Positions stay float64 (exact indices on long clips); the per-sample
+        # lerp runs in float32, which holds 16-bit PCM exactly at half the traffic.
+        frac = (pos - i0).astype(np.float32)[:, None]
+
+        lo = src[i0].astype(np.float32)
+        shifted = src[i1] - lo
+        shifted *= frac
+        shifted += lo
+        np.clip(shifted, -32768, 32767, out=shifted)
+        shifted = shifted.astype(arr.dtype).reshape((new_len,) + arr.shape[1:])
 
         new_snd = pygame.sndarray.make_sound(shifted)
         # Preserve volume from the original
@@ -145,6 +150,14 @@ class SoundManager:
         # Registry: maps each sound to its desired category weight
         _sound_registry: dict = {}
 
+        # Index the sound bank once (os.walk is scandir-backed) instead of
+        # stat-ing every candidate path individually with os.path.exists.
+        _available: dict = {}
+        for root, _dirs, files in os.walk(base_path):
+            rel = os.path.relpath(root, base_path)
+            for name in files:
+                _available[os.path.normpath(os.path.join(rel, name))] = os.path.join(root, name)
+
         def load(subfolder: str, filename: str, volume: float = 0.5):
             """Internal helper: load a sound file and set its base volume.
 
@@ -156,8 +169,8 @@ class SoundManager:
             Returns:
                 A Pygame Sound object, or None if the file is missing.
             """
-            path = os.path.join(base_path, subfolder, filename)
-            if os.path.exists(path):
+            path = _available.get(os.path.normpath(os.path.join(subfolder, filename)))
+            if path is not None:
                 snd = pygame.mixer.Sound(path)
                 _sound_registry[snd] = volume
                 return snd
@@ -229,6 +242,7 @@ class SoundManager:
         self.arena_pulse_sound = load("feedback", "arena_pulse.mp3", 0.50)
 
         self._sound_registry = _sound_registry
+        self._rms_map = {}          # Sound -> measured RMS, filled by _normalize_all()
         self._normalize_all(self._sound_registry)
 
     # ------------------------------------------------------------------
@@ -238,14 +252,25 @@ class SoundManager:
     def _normalize_all(self, registry: dict):
         if not registry:
             return
-        rms_map = {snd: _compute_rms(snd) for snd in registry}
-        min_rms = min(rms_map.values())
+        # RMS depends only on the sample data, so each sound is measured the first
+        # time it is seen and reused on later passes (e.g. master volume changes).
+        rms_map = self._rms_map
+        levels = {}
+        for snd in registry:
+            rms = rms_map.get(snd)
+            if rms is None:
+                rms = rms_map[snd] = _compute_rms(snd)
+            levels[snd] = rms
+        min_rms = min(levels.values())
         for snd, category_weight in registry.items():
-            factor = min_rms / rms_map[snd]
+            factor = min_rms / levels[snd]
             snd.set_volume(max(0.0, min(1.0, factor * category_weight * self.master_volume)))
 
     def set_master_volume(self, level: float):
-        self.master_volume = max(0.0, min(1.0, level))
+        level = max(0.0, min(1.0, level))
+        if level == self.master_volume:
+            return                                   # nothing to re-apply
+        self.master_volume = level
         self._normalize_all(self._sound_registry)  # re-runs normalization with new level
 
     def _resolve_weapon(self, weapon: str) -> str:
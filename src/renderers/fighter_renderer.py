@@ -37,7 +37,9 @@ class FighterRenderer:
         self._weapon_base = pygame.transform.scale(raw, cfg['sprite_size'])
         self._orig_w, self._orig_h = cfg['sprite_size']
         self._trail_cache = {}
-        self._rotation_cache = {}
+        self._trail_lut = {}                  # (color, radius, trail length) -> per-index stamps
+        self._rotation_cache = [None] * 360   # indexed by integer degree
+        self._body_cache = {}
 
 
     def render(self, fighter, surface: pygame.Surface, offset=(0, 0)):
@@ -49,36 +51,48 @@ class FighterRenderer:
             offset: Global camera/arena offset.
         """
         ox, oy = offset
-        r = fighter.radius
 
         self._draw_trail(fighter, surface, offset)
-
-        cx = int(fighter.x + ox)
-        cy = int(fighter.y + oy)
-
-        flashing     = fighter.flash_timer > 0
-        body_color   = WHITE if flashing else fighter.color
-        border_color = WHITE if flashing else tuple(max(0, c - 80) for c in fighter.color)
-
-        pygame.draw.circle(surface, border_color, (cx, cy), int(r) + BORDER_THICKNESS)
-        pygame.draw.circle(surface, body_color,   (cx, cy), int(r))
-
+        self._draw_body(fighter, surface, ox, oy)
         self._draw_weapon(fighter, surface, offset)
 
 
     def render_body_only(self, fighter, surface: pygame.Surface, offset=(0, 0)):
         """Renders only the fighter's body, used for specific UI or effect layers."""
         ox, oy = offset
-        r = fighter.radius
-        cx = int(fighter.x + ox)
-        cy = int(fighter.y + oy)
+        self._draw_body(fighter, surface, ox, oy)
+
+
+    def _draw_body(self, fighter, surface: pygame.Surface, ox: float, oy: float):
+        """Blits the bordered body disc from a sprite cached per (color, flash, radius)."""
+        r = int(fighter.radius)
+        flashing = fighter.flash_timer > 0
+        key = (fighter.color, flashing, r)
+        sprite = self._body_cache.get(key)
+        if sprite is None:
+            sprite = self._body_cache[key] = self._render_body(fighter.color, flashing, r)
+        outer_r = r + BORDER_THICKNESS
+        surface.blit(sprite, (int(fighter.x + ox) - outer_r, int(fighter.y + oy) - outer_r))
+
+
+    @staticmethod
+    def _render_body(color, flashing, r):
+        """Rasterizes the border ring + body disc once onto a colorkeyed sprite."""
+        body_color   = WHITE if flashing else color
+        border_color = WHITE if flashing else tuple(max(0, c - 80) for c in color)
 
-        flashing     = fighter.flash_timer > 0
-        body_color   = WHITE if flashing else fighter.color
-        border_color = WHITE if flashing else tuple(max(0, c - 80) for c in fighter.color)
+        # Colorkey blits are cheaper than per-pixel alpha; pick a key neither fill uses
+        key_color = next(k for k in ((0, 0, 0), (0, 0, 1), (0, 1, 0))
+                         if k not in (body_color, border_color))
 
-        pygame.draw.circle(surface, border_color, (cx, cy), int(r) + BORDER_THICKNESS)
-        pygame.draw.circle(surface, body_color,   (cx, cy), int(r))
+        outer_r = r + BORDER_THICKNESS
+        size = outer_r * 2 + 1
+        sprite = pygame.Surface((size, size))
+        sprite.fill(key_color)
+        sprite.set_colorkey(key_color)
+        pygame.draw.circle(sprite, border_color, (outer_r, outer_r), outer_r)
+        pygame.draw.circle(sprite, body_color,   (outer_r, outer_r), r)
+        return sprite
 
 
     def _draw_trail(self, fighter, surface: pygame.Surface, offset: tuple):
@@ -89,12 +103,30 @@ class FighterRenderer:
         smaller sizes per segment to create a smooth 'blur' rather than 
         discrete ghosting.
         """
-        if len(fighter.trail) < 2:
+        trail_len = len(fighter.trail)
+        if trail_len < 2:
             return
         ox, oy = offset
 
-        trail_len = len(fighter.trail)
+        # Every per-index stamp depends only on (color, radius, trail length), so
+        # the fade math runs once per combination and the loop just indexes it.
+        lut_key = (fighter.color, fighter.radius, trail_len)
+        lut = self._trail_lut.get(lut_key)
+        if lut is None:
+            lut = self._trail_lut[lut_key] = self._build_trail_lut(*lut_key)
+
+        # Collect every stamp first and hand them to SDL in a single blits() call
+        stamps = []
+        for (tx, ty), entry in zip(fighter.trail, lut):
+            if entry is not None:
+                trail_surf, trail_r = entry
+                stamps.append((trail_surf, (int(tx + ox) - trail_r, int(ty + oy) - trail_r)))
+
+        surface.blits(stamps, doreturn=False)
+
 
+    def _build_trail_lut(self, color, radius, trail_len):
+        """Resolves each trail index to its (stamp surface, radius), or None when faded out."""
         # Longer trails (dagger = 16) need to shrink and fade more aggressively
         # per step so they read as motion blur rather than ghost copies.
         # Base trail (8 steps) uses size_mult=0.55, alpha_max=80.
@@ -106,31 +138,29 @@ class FighterRenderer:
         size_mult  = 0.55 - 0.25 * t   # 0.55 at base → 0.30 at long
         alpha_max  = 80   - 35   * t   # 80   at base → 45  at long
 
-        for i, (tx, ty) in enumerate(fighter.trail):
+        cache = self._trail_cache
+        lut = []
+        for i in range(trail_len):
             # Normalised position: 0 = most recent (bright), 1 = oldest (gone)
             frac = i / trail_len
             fade = (1.0 - frac) * TRAIL_FADE_RATE
-            if fade <= 0:
-                continue
-
-            trail_r = int(fighter.radius * fade * size_mult)
-            if trail_r < 2:
-                continue
-
+            trail_r = int(radius * fade * size_mult)
             alpha = int(alpha_max * fade)
-            if alpha <= 0:
+            if fade <= 0 or trail_r < 2 or alpha <= 0:
+                lut.append(None)
                 continue
 
-            cache_key = (fighter.color, trail_r, alpha)
-            if cache_key in self._trail_cache:
-                trail_surf = self._trail_cache[cache_key]
-            else:
+            cache_key = (color, trail_r, alpha)
+            trail_surf = cache.get(cache_key)
+            if trail_surf is None:
                 trail_surf = pygame.Surface((trail_r * 2, trail_r * 2), pygame.SRCALPHA)
                 pygame.draw.circle(
-                    trail_surf, (*fighter.color[:3], alpha), (trail_r, trail_r), trail_r
+                    trail_surf, (*color[:3], alpha), (trail_r, trail_r), trail_r
                 )
-                self._trail_cache[cache_key] = trail_surf
-            surface.blit(trail_surf, (int(tx + ox) - trail_r, int(ty + oy) - trail_r))
+                # Match the display's pixel format so repeat blits take the fast path
+                trail_surf = cache[cache_key] = trail_surf.convert_alpha()
+            lut.append((trail_surf, trail_r))
+        return lut
 
 
     def _draw_weapon(self, fighter, surface: pygame.Surface, offset: tuple):
@@ -152,9 +182,7 @@ class FighterRenderer:
         # World-space tip (used by combat_manager for sword_trail)
         tip_wx = fighter.x + cos_a * (r + 3 + fighter.sword_length)
         tip_wy = fighter.y + sin_a * (r + 3 + fighter.sword_length)
-        fighter.sword_trail.append((tip_wx, tip_wy))
-        if len(fighter.sword_trail) > 5:
-            fighter.sword_trail = fighter.sword_trail[-5:]
+        fighter.sword_trail.append((tip_wx, tip_wy))   # bounded deque keeps the last 5
 
         # Screen-space handle (body edge)
         base_sx = fighter.x + ox + cos_a * (r + 3)
@@ -162,9 +190,8 @@ class FighterRenderer:
 
         # Rotate CW by angle (lazy-cached to nearest integer degree)
         angle_deg = int(math.degrees(angle)) % 360
-        if angle_deg in self._rotation_cache:
-            rotated = self._rotation_cache[angle_deg]
-        else:
+        rotated = self._rotation_cache[angle_deg]
+        if rotated is None:
             rotated = pygame.transform.rotate(self._weapon_base, -angle_deg)
             self._rotation_cache[angle_deg] = rotated
 
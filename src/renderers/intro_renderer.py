@@ -16,6 +16,16 @@ _LABEL_CENTER_Y  = SCREEN_HEIGHT // 4        # vertical anchor (~150px)
 _LABEL_INSET_X   = SCREEN_WIDTH  // 4        # how far from center each side sits
 
 
+class _TextCache(dict):
+    """(font, text, color) -> rendered surface; renders on first lookup."""
+    __slots__ = ()
+
+    def __missing__(self, key):
+        font, text, color = key
+        surf = self[key] = font.render(text, True, color)
+        return surf
+
+
 class IntroRenderer:
     """
     Pluggable intro renderer.
@@ -39,7 +49,9 @@ class IntroRenderer:
         self._font_name   = pygame.font.Font(None, 52)   # fighter name
         self._font_weapon = pygame.font.Font(None, 26)   # weapon tag
         self._font_vs = pygame.font.Font(None, 32)
-        self._text_cache = {}
+        self._text_cache = _TextCache()
+        self._label_cache = {}   # (weapon, name, color, bright) -> pre-rendered card
+        self._vs_surfs = None    # ("VS" surface, "VS" glow surface), rendered on first use
         # Pre-allocate white flash surface to avoid per-frame allocations during countdown
         self._flash_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self._flash_surf.fill(WHITE)
@@ -71,12 +83,7 @@ class IntroRenderer:
     def draw_countdown(self, screen, stage, timer, durations, texts,
                        f1_color, f2_color, f1_bright, f2_bright,
                        flash_timer, flash_duration, font_large):
-        def get_rendered_text(text, font, color):
-            key = (text, color)
-            if key not in self._text_cache:
-                self._text_cache[key] = font.render(text, True, color)
-            return self._text_cache[key]
-
+        text_cache = self._text_cache
         countdown_text = texts[stage]
         duration = durations[stage]
         progress = timer / max(1, duration)
@@ -104,7 +111,7 @@ class IntroRenderer:
             shrink = min(0.08, progress * 0.08)                # gentle shrink toward end
             scale  = 1.0 + pop * 0.5 - shrink
  
-            num_surf = get_rendered_text(countdown_text, font_large, WHITE)
+            num_surf = text_cache[font_large, countdown_text, WHITE]
             new_w = max(1, int(num_surf.get_width()  * scale))
             new_h = max(1, int(num_surf.get_height() * scale))
             num_surf = pygame.transform.scale(num_surf, (new_w, new_h))
@@ -114,15 +121,16 @@ class IntroRenderer:
             glow_primary   = f1_color if stage % 2 == 0 else f2_color
             glow_secondary = f2_color if stage % 2 == 0 else f1_color
             for glow_color, alpha_val in [(glow_primary, 90), (glow_secondary, 55)]:
-                glow = get_rendered_text(countdown_text, font_large, glow_color)
+                glow = text_cache[font_large, countdown_text, glow_color]
                 glow = pygame.transform.scale(glow, (new_w, new_h))
                 glow.set_alpha(alpha_val)
-                for dx, dy in [(-5, 0), (5, 0), (0, -5), (0, 5),
-                                (-4, -4), (4, 4), (-4, 4), (4, -4)]:
-                    screen.blit(glow, num_rect.move(dx, dy))
+                screen.blits([(glow, num_rect.move(dx, dy))
+                              for dx, dy in [(-5, 0), (5, 0), (0, -5), (0, 5),
+                                             (-4, -4), (4, 4), (-4, 4), (4, -4)]],
+                             doreturn=False)
  
             # Drop shadow
-            shadow = get_rendered_text(countdown_text, font_large, BLACK)
+            shadow = text_cache[font_large, countdown_text, BLACK]
             shadow = pygame.transform.scale(shadow, (new_w, new_h))
             shadow.set_alpha(160)
             screen.blit(shadow, num_rect.move(4, 4))
@@ -135,20 +143,21 @@ class IntroRenderer:
         # ── Stage 3: FIGHT ──────────────────────────────────────────────
         ease = 1 - (1 - progress) ** 3
         scale = 0.6 + ease * 1.0
-        text_surface = get_rendered_text(countdown_text, font_large, WHITE)
+        text_surface = text_cache[font_large, countdown_text, WHITE]
         new_w = max(1, int(text_surface.get_width() * scale))
         new_h = max(1, int(text_surface.get_height() * scale))
         text_surface = pygame.transform.scale(text_surface, (new_w, new_h))
         text_rect = text_surface.get_rect(center=(cx, cy))
         
         for glow_color, alpha_val in [(f1_color, 80), (f2_color, 60)]:
-            glow = get_rendered_text(countdown_text, font_large, glow_color)
+            glow = text_cache[font_large, countdown_text, glow_color]
             glow = pygame.transform.scale(glow, (new_w, new_h))
             glow.set_alpha(alpha_val)
-            for dx, dy in [(-4,0),(4,0),(0,-4),(0,4),(-3,-3),(3,3),(-3,3),(3,-3)]:
-                screen.blit(glow, text_rect.move(dx, dy))
+            screen.blits([(glow, text_rect.move(dx, dy))
+                          for dx, dy in [(-4,0),(4,0),(0,-4),(0,4),(-3,-3),(3,3),(-3,3),(3,-3)]],
+                         doreturn=False)
         
-        shadow = get_rendered_text(countdown_text, font_large, BLACK)
+        shadow = text_cache[font_large, countdown_text, BLACK]
         shadow = pygame.transform.scale(shadow, (new_w, new_h))
         shadow.set_alpha(150)
         screen.blit(shadow, text_rect.move(3, 3))
@@ -188,14 +197,16 @@ class IntroRenderer:
                               f2_color, f2_bright, align='center')
 
         # VS indicator — centered between the two cards
-        vs_surf = self._font_vs.render("VS", True, (180, 180, 160))
+        if self._vs_surfs is None:
+            vs_glow = self._font_weapon.render("VS", True, (200, 200, 220))
+            vs_glow.set_alpha(30)
+            self._vs_surfs = (self._font_vs.render("VS", True, (180, 180, 160)), vs_glow)
+        vs_surf, vs_glow = self._vs_surfs
         vs_rect = vs_surf.get_rect(center=(cx, cy))
 
         # Subtle glow behind VS
-        vs_glow = self._font_weapon.render("VS", True, (200, 200, 220))
-        vs_glow.set_alpha(30)
-        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            screen.blit(vs_glow, vs_rect.move(dx, dy))
+        screen.blits([(vs_glow, vs_rect.move(dx, dy)) for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]],
+                     doreturn=False)
 
         screen.blit(vs_surf, vs_rect)
  
@@ -213,39 +224,57 @@ class IntroRenderer:
             bright_color: Brightened fighter RGB for glow.
             align:        Text alignment — 'center', 'left', or 'right'.
         """
+        key = (weapon_name, fighter_name, color, bright_color)
+        card = self._label_cache.get(key)
+        if card is None:
+            card = self._label_cache[key] = self._render_label_card(
+                weapon_name, fighter_name, color, bright_color)
+        name_surf, glow_surf, weapon_surf, rule_color = card
+
         NAME_GAP   = 4    # px between name bottom and divider
         WEAPON_GAP = 6    # px between divider and weapon tag top
         RULE_W     = 60   # width of the horizontal divider rule
-        dim_color  = tuple(max(0, int(c * 0.60)) for c in color)
  
         # --- Name surface ---
-        display_name = fighter_name.split("_")[0]
-        name_surf = self._font_name.render(display_name.upper(), True, WHITE)
         name_rect = name_surf.get_rect(center=(cx, cy))
  
-        # Glow halo — 3 offset blits in bright_color at low alpha
-        glow_surf = self._font_name.render(display_name.upper(), True, bright_color)
-        glow_surf.set_alpha(55)
-        for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-            screen.blit(glow_surf, name_rect.move(dx, dy))
+        # Glow halo — 4 offset blits in bright_color at low alpha
+        screen.blits([(glow_surf, name_rect.move(dx, dy)) for dx, dy in [(-2,0),(2,0),(0,-2),(0,2)]],
+                     doreturn=False)
  
         screen.blit(name_surf, name_rect)
  
         # --- Horizontal rule ---
         rule_y = name_rect.bottom + NAME_GAP
         rule_x = cx - RULE_W // 2
-        rule_color = tuple(max(0, int(c * 0.50)) for c in color)
         pygame.draw.line(screen, rule_color,
                          (rule_x, rule_y), (rule_x + RULE_W, rule_y), 1)
  
         # --- Weapon tag ---
-        weapon_surf = self._font_weapon.render(weapon_name.upper(), True, dim_color)
         weapon_rect = weapon_surf.get_rect(
             centerx=cx, top=rule_y + WEAPON_GAP
         )
         screen.blit(weapon_surf, weapon_rect)
 
 
+    def _render_label_card(self, weapon_name, fighter_name, color, bright_color):
+        """
+        Rasterize a matchup card's text once; the card is static for the match.
+
+        Returns:
+            (name_surf, glow_surf, weapon_surf, rule_color)
+        """
+        dim_color  = tuple(max(0, int(c * 0.60)) for c in color)
+        rule_color = tuple(max(0, int(c * 0.50)) for c in color)
+
+        display_name = fighter_name.split("_")[0].upper()
+        name_surf = self._font_name.render(display_name, True, WHITE)
+        glow_surf = self._font_name.render(display_name, True, bright_color)
+        glow_surf.set_alpha(55)
+        weapon_surf = self._font_weapon.render(weapon_name.upper(), True, dim_color)
+        return name_surf, glow_surf, weapon_surf, rule_color
+
+
     # ------------------------------------------------------------------ #
     #  Shared helpers                                                      #
     # ------------------------------------------------------------------ #
@@ -30,9 +30,11 @@ class OutroRenderer:
         self.font_large = font_large
         self._text_cache = {}
         self._rotation_cache = {}
-        # Pre-allocate small surface for the winner's glow ring to avoid full-screen allocations every frame
-        r_glow = FIGHTER_RADIUS + 14
-        self._glow_surf = pygame.Surface((r_glow * 2, r_glow * 2), pygame.SRCALPHA)
+        # Winner glow rings, drawn once per color onto a small surface and reused every frame
+        self._glow_cache = {}
+        # (winner text, color) -> prebuilt "WINS" glow + text blit sequence
+        self._wins_cache = {}
+        self._clip_rect = pygame.Rect(0, 0, 0, 0)   # Arena clip, updated in place per frame
 
     # ------------------------------------------------------------------ #
     #  WINNER OUTRO                                                        #
@@ -89,9 +91,9 @@ class OutroRenderer:
         
         # Cache rendered text surfaces
         text_key = (winner_text, WHITE)
-        if text_key not in self._text_cache:
-            self._text_cache[text_key] = self.font_large.render(winner_text, True, WHITE)
-        text_surface = self._text_cache[text_key]
+        text_surface = self._text_cache.get(text_key)
+        if text_surface is None:
+            text_surface = self._text_cache[text_key] = self.font_large.render(winner_text, True, WHITE)
 
         gap = 25
         total_height = (FIGHTER_RADIUS * 2) + gap + text_surface.get_height()
@@ -102,11 +104,14 @@ class OutroRenderer:
         draw_offset = (cx - winner.x, circle_cy - winner.y)
         winner.draw_body_only(screen, draw_offset)
 
-        # ── Subtle glow ring (reusable small surface) ────────────────────
+        # ── Subtle glow ring (cached per winner color) ───────────────────
         r_glow = FIGHTER_RADIUS + 14
-        self._glow_surf.fill((0, 0, 0, 0))
-        pygame.draw.circle(self._glow_surf, (*win_color, 18), (r_glow, r_glow), r_glow)
-        screen.blit(self._glow_surf, (cx - r_glow, circle_cy - r_glow))
+        glow_ring = self._glow_cache.get(win_color)
+        if glow_ring is None:
+            glow_ring = pygame.Surface((r_glow * 2, r_glow * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_ring, (*win_color, 18), (r_glow, r_glow), r_glow)
+            glow_ring = self._glow_cache[win_color] = glow_ring.convert_alpha()
+        screen.blit(glow_ring, (cx - r_glow, circle_cy - r_glow))
 
         # ── Spinning weapon orbiting the fighter body ─────────────────────
         raw_sprite = None
@@ -130,9 +135,8 @@ class OutroRenderer:
             # Rotate CW by angle (lazy-cached to nearest integer degree)
             spin_deg = int(math.degrees(spin_angle)) % 360
             cache_key = (winner.weapon, spin_deg)
-            if cache_key in self._rotation_cache:
-                rotated = self._rotation_cache[cache_key]
-            else:
+            rotated = self._rotation_cache.get(cache_key)
+            if rotated is None:
                 rotated = pygame.transform.rotate(scaled_sprite, -spin_deg)
                 self._rotation_cache[cache_key] = rotated
 
@@ -142,23 +146,26 @@ class OutroRenderer:
             weapon_rect = rotated.get_rect(center=(int(rot_center_x), int(rot_center_y)))
 
             # Clip weapon to arena bounds so it doesn't bleed into the HUD
-            clip_rect = pygame.Rect(int(ax), int(ay), int(aw), int(ah))
+            clip_rect = self._clip_rect
+            clip_rect.update(int(ax), int(ay), int(aw), int(ah))
             screen.set_clip(clip_rect)
             screen.blit(rotated, weapon_rect)
             screen.set_clip(None)
 
         # ── "WINS" text with color glow ───────────────────────────────────
-        text_cy = top_y + FIGHTER_RADIUS * 2 + gap + text_surface.get_height() // 2
-        text_rect = text_surface.get_rect(center=(cx, text_cy))
-
-        glow_key = (winner_text, win_color)
-        if glow_key not in self._text_cache:
-            self._text_cache[glow_key] = self.font_large.render(winner_text, True, win_color)
-        glow_surface = self._text_cache[glow_key]
-
-        glow_surface.set_alpha(90)
-        for dx, dy in [(-4, 0), (4, 0), (0, -4), (0, 4)]:
-            screen.blit(glow_surface, text_rect.move(dx, dy))
-
-        screen.blit(text_surface, text_rect)
-
+        # The layout depends only on the text and winner color, so the whole
+        # glow + text stamp list is built once and replayed with one blits call.
+        wins_key = (winner_text, win_color)
+        wins_stamps = self._wins_cache.get(wins_key)
+        if wins_stamps is None:
+            text_cy = top_y + FIGHTER_RADIUS * 2 + gap + text_surface.get_height() // 2
+            text_rect = text_surface.get_rect(center=(cx, text_cy))
+
+            glow_surface = self.font_large.render(winner_text, True, win_color)
+            glow_surface.set_alpha(90)
+            wins_stamps = [(glow_surface, text_rect.move(dx, dy))
+                           for dx, dy in [(-4, 0), (4, 0), (0, -4), (0, 4)]]
+            wins_stamps.append((text_surface, text_rect))
+            self._wins_cache[wins_key] = wins_stamps
+
+        screen.blits(wins_stamps, doreturn=False)
@@ -55,10 +55,20 @@ class UIRenderer:
         for i in range(-28, 600 + 28, 13):
             pygame.draw.line(self._master_stripe_surf, (255, 255, 255, 28),
                              (i, 0), (i + 28, 28), 4)
+        self._master_stripe_surf = self._master_stripe_surf.convert_alpha()
 
         # Pre-allocate reusable scratch surface for polygon glows
         self._glow_scratch_surf = pygame.Surface((600, 100), pygame.SRCALPHA)
 
+        # Pre-rendered segment divider overlays, keyed by bar (w, h)
+        self._divider_cache = {}
+
+        # Derived bar shades, keyed by (color, factor) — fighter colors are fixed per match
+        self._shade_cache = {}
+
+        # Pre-rendered health bar end caps, keyed by (fighter color, radius)
+        self._cap_cache = {}
+
 
     def draw(self, game):
         """Main entry point for rendering the entire UI overlay."""
@@ -172,7 +182,7 @@ class UIRenderer:
         Both are clipped to the bar rect so they never bleed outside.
         """
         color     = fighter.health_bar_color
-        dim_color = tuple(max(0, int(c * 0.55)) for c in color)
+        dim_color = self._shade(color, 0.55)
  
         name_surf   = self.font_tiny.render(name.upper(),   True, (220, 220, 230))
         weapon_surf = self.font_tiny.render(weapon.upper(), True, dim_color)
@@ -216,9 +226,9 @@ class UIRenderer:
             bg_poly = [(x, y), (x+w, y), (x+w, y+h), (x, y+h), (x-tip, y+half_h)]
 
         # 1. Ghost drain layer — entire arrow filled with dim fighter color
-        ghost_bg = tuple(max(0, int(c * 0.22)) for c in fighter.health_bar_color)
+        ghost_bg = self._shade(fighter.health_bar_color, 0.22)
         pygame.draw.polygon(self.screen, ghost_bg, bg_poly)
-        ghost_border_color = tuple(max(0, int(c * 0.45)) for c in fighter.health_bar_color)
+        ghost_border_color = self._shade(fighter.health_bar_color, 0.45)
         pygame.draw.polygon(self.screen, ghost_border_color, bg_poly, 1)
  
         # 2. Ghost fill (the trailing indicator — sits between ghost_pct and hp_pct)
@@ -226,7 +236,7 @@ class UIRenderer:
         fill_w       = int(w * hp_pct)
  
         if ghost_fill_w > fill_w:
-            ghost_color = tuple(max(0, int(c * 0.48)) for c in fighter.health_bar_color)
+            ghost_color = self._shade(fighter.health_bar_color, 0.48)
             if facing == 'right':
                 ghost_poly = [
                     (x + fill_w, y), (x + ghost_fill_w, y),
@@ -267,18 +277,42 @@ class UIRenderer:
             self.screen.set_clip(old_clip)
  
             # Top-edge highlight
-            hi = tuple(min(255, int(c * 1.7)) for c in color)
+            hi = self._shade(color, 1.7)
             pygame.draw.line(self.screen, hi, (fill_x, y+2), (fill_x+fill_w, y+2), 2)
  
-        # 4. Segment dividers
-        for i in range(1, 10):
-            sx = x + int(w * i / 10)
-            pygame.draw.line(self.screen, (0, 0, 0), (sx, y+2), (sx, y+h-2), 1)
+        # 4. Segment dividers (one colorkeyed blit instead of 9 line calls)
+        self.screen.blit(self._get_divider_surf(w, h), (x, y))
  
         # 5. Outer border
         pygame.draw.polygon(self.screen, (80, 80, 100), bg_poly, 2)
 
 
+    def _shade(self, color, factor):
+        """Returns `color` scaled by `factor` and clamped to 0-255, memoized per pair."""
+        key = (color, factor)
+        shade = self._shade_cache.get(key)
+        if shade is None:
+            shade = self._shade_cache[key] = tuple(
+                max(0, min(255, int(c * factor))) for c in color
+            )
+        return shade
+
+
+    def _get_divider_surf(self, w, h):
+        """Returns the cached 10-segment divider overlay for a bar of size (w, h)."""
+        surf = self._divider_cache.get((w, h))
+        if surf is None:
+            key_color = (255, 0, 255)
+            surf = pygame.Surface((w + 1, h))
+            surf.fill(key_color)
+            surf.set_colorkey(key_color)
+            for i in range(1, 10):
+                sx = int(w * i / 10)
+                pygame.draw.line(surf, (0, 0, 0), (sx, 2), (sx, h - 2), 1)
+            self._divider_cache[(w, h)] = surf
+        return surf
+
+
     def _draw_poly_glow(self, poly, color, expand=5):
         """Additively blends a soft color bloom behind the given polygon."""
         xs = [p[0] for p in poly]
@@ -301,15 +335,33 @@ class UIRenderer:
         
         Layers: dark shell → fighter-colored diamond → highlight facet → border ring
         """
-        cx, cy = int(cx), int(cy)
         color = fighter.health_bar_color
-        dim = tuple(max(0, int(c * 0.45)) for c in color)
+        sprite = self._cap_cache.get((color, r))
+        if sprite is None:
+            sprite = self._cap_cache[(color, r)] = self._render_bar_cap(color, r)
+        self.screen.blit(sprite, (int(cx) - r, int(cy) - r))
+
+
+    def _render_bar_cap(self, color, r):
+        """Rasterizes the gem cap layers once onto a colorkeyed sprite centered at (r, r)."""
+        dim = self._shade(color, 0.45)
+        hi = self._shade(color, 1.55)        # highlight facet, 55% brighter
         dark = (18, 18, 25)
+        white = (255, 255, 255)
+        ring = (90, 90, 115)
+
+        key_color = next(k for k in ((0, 0, 0), (0, 0, 1), (0, 1, 0))
+                         if k not in (color, dim, hi))
+        size = r * 2 + 1
+        sprite = pygame.Surface((size, size))
+        sprite.fill(key_color)
+        sprite.set_colorkey(key_color)
+        cx = cy = r
 
         # Shell
-        pygame.draw.circle(self.screen, dark,  (cx, cy), r)
-        pygame.draw.circle(self.screen, dim,   (cx, cy), r - 2)
-        pygame.draw.circle(self.screen, dark,  (cx, cy), r - 5)
+        pygame.draw.circle(sprite, dark,  (cx, cy), r)
+        pygame.draw.circle(sprite, dim,   (cx, cy), r - 2)
+        pygame.draw.circle(sprite, dark,  (cx, cy), r - 5)
 
         # Gem diamond — sized to sit neatly inside the inner dark circle
         gem_r = r - 7
@@ -319,23 +371,23 @@ class UIRenderer:
             (cx, cy + gem_r),   # bottom
             (cx - gem_r, cy),   # left
         ]
-        pygame.draw.polygon(self.screen, color, gem)
+        pygame.draw.polygon(sprite, color, gem)
 
-        # Highlight facet (upper-left triangle of the diamond, 55% brighter)
-        hi = tuple(min(255, int(c * 1.55)) for c in color)
+        # Highlight facet (upper-left triangle of the diamond)
         facet = [
             (cx, cy - gem_r),  # top
             (cx + gem_r, cy),          # right  (top-right half)
             (cx, cy),          # center
         ]
-        pygame.draw.polygon(self.screen, hi, facet)
+        pygame.draw.polygon(sprite, hi, facet)
 
         # Small specular dot
         spec_r = max(1, gem_r // 3)
-        pygame.draw.circle(self.screen, (255, 255, 255), (cx - spec_r, cy - spec_r), spec_r)
+        pygame.draw.circle(sprite, white, (cx - spec_r, cy - spec_r), spec_r)
 
         # Outer border ring
-        pygame.draw.circle(self.screen, (90, 90, 115), (cx, cy), r, 2)
+        pygame.draw.circle(sprite, ring, (cx, cy), r, 2)
+        return sprite
 
 
     def _get_bar_color(self, fighter) -> tuple: